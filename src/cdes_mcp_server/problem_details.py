@@ -19,6 +19,7 @@ import logging
 import uuid
 from typing import Any, Callable
 
+import orjson
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -111,10 +112,12 @@ def problem_json(
     """Build a ProblemDetail and return it as a JSON string."""
     problem = build_problem(status, **kwargs)
     _log_problem(problem, tool_name=kwargs.get("instance", ""))
-    return json.dumps(
-        problem.model_dump(exclude_none=True),
-        default=str,
-    )
+    return _problem_to_json(problem)
+
+
+def _problem_to_json(problem: ProblemDetail) -> str:
+    """Serialize a ProblemDetail, omitting unset fields."""
+    return orjson.dumps(problem.model_dump(exclude_none=True), default=str).decode()
 
 
 # -- Logging ------------------------------------------------------------
@@ -184,7 +187,7 @@ def safe_tool_call(
             instance=f"/mcp/tool/{tool_name}",
         )
         _log_problem(problem, tool_name=tool_name, exc=exc)
-        return json.dumps(problem.model_dump(exclude_none=True), default=str)
+        return _problem_to_json(problem)
 
     except json.JSONDecodeError as exc:
         problem = build_problem(
@@ -196,7 +199,7 @@ def safe_tool_call(
             action=ProblemAction(type="retry", label="Sync schemas from GitHub"),
         )
         _log_problem(problem, tool_name=tool_name, exc=exc)
-        return json.dumps(problem.model_dump(exclude_none=True), default=str)
+        return _problem_to_json(problem)
 
     except KeyError as exc:
         problem = build_problem(
@@ -207,7 +210,7 @@ def safe_tool_call(
             instance=f"/mcp/tool/{tool_name}",
         )
         _log_problem(problem, tool_name=tool_name, exc=exc)
-        return json.dumps(problem.model_dump(exclude_none=True), default=str)
+        return _problem_to_json(problem)
 
     except Exception as exc:
         detail_msg = f"Unexpected error in {tool_name}"
@@ -223,4 +226,4 @@ def safe_tool_call(
             action=ProblemAction(type="retry", label="Retry"),
         )
         _log_problem(problem, tool_name=tool_name, exc=exc)
-        return json.dumps(problem.model_dump(exclude_none=True), default=str)
+        return _problem_to_json(problem)
@@ -31,15 +31,21 @@ else:
 
 from __future__ import annotations
 
-import json
+import bisect
+import functools
+import importlib.util
 import logging
+import mmap
 import os
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import anyio
+import anyio.to_thread
 import httpx
 import jsonschema
+import orjson
 import referencing
 import referencing.jsonschema
 import uvicorn
@@ -48,12 +54,15 @@ from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
 from cdes_mcp_server.problem_details import problem_json, safe_tool_call
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from jsonschema.protocols import Validator
     from starlette.requests import Request
 
 logger = logging.getLogger(__name__)
@@ -85,8 +94,19 @@ _GITHUB_REFERENCE_MAP: dict[str, tuple[str, str]] = {
     "cannabinoid-therapeutics": ("cannabinoids", "cannabinoid-therapeutics.json"),
 }
 
+# HTTP client settings for GitHub sync.  Every file comes from
+# raw.githubusercontent.com, so HTTP/2 multiplexes them over one connection.
+_GITHUB_TIMEOUT = httpx.Timeout(30, connect=5)
+_GITHUB_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+_GITHUB_RETRIES = 2
+# Upper bound on in-flight GitHub requests during a sync
+_GITHUB_MAX_CONCURRENCY = 8
+
 _last_sync: datetime | None = None
 
+# Serialized /health body, rebuilt by _refresh_health() whenever it changes
+_HEALTH_BYTES: bytes = b""
+
 # ---------------------------------------------------------------------------
 # Server initialisation
 # ---------------------------------------------------------------------------
@@ -116,98 +136,631 @@ _SCHEMA_CACHE: dict[str, dict[str, Any]] = {}
 # Reference data cache: name -> loaded dict
 _REFERENCE_CACHE: dict[str, dict[str, Any]] = {}
 
+# jsonschema validators: name -> validator.
+# Format assertions are off; format-checking variants are built on request.
+_DRAFT_VALIDATOR_CACHE: dict[str, Validator] = {}
+_FORMAT_VALIDATOR_CACHE: dict[str, Validator] = {}
+
+# Registry resolving $ref between CDES schemas (built on first use)
+_REGISTRY: referencing.Registry | None = None
+
+# Data files on disk by stem, and their sorted stems; rescanned at import
+# and after each sync
+_SCHEMA_FILES: dict[str, Path] = {}
+_REFERENCE_FILES: dict[str, Path] = {}
+_SCHEMA_NAMES: list[str] = []
+_REFERENCE_NAMES: list[str] = []
+
+# Lookup indexes over reference data (rebuilt whenever a library loads);
+# name keys are casefolded
+_TERPENE_BY_ID: dict[str, dict[str, Any]] = {}
+_TERPENE_BY_NAME: dict[str, dict[str, Any]] = {}
+_CANNABINOID_BY_ID: dict[str, dict[str, Any]] = {}
+_CANNABINOID_BY_NAME: dict[str, dict[str, Any]] = {}
+_TERPENE_COLOR_BY_NAME: dict[str, dict[str, Any]] = {}
+
+# First ten names listed in not-found errors, per reference data set
+_AVAILABLE_PREVIEW: dict[str, str] = {}
+
+# Summary rows for list_terpenes / list_cannabinoids, extracted once per load:
+# (id, name, casNumber, category, aroma, boilingPoint) and
+# (id, name, fullName, psychoactive, color, effects)
+_TERPENE_ROWS: list[tuple[Any, ...]] = []
+_CANNABINOID_ROWS: list[tuple[Any, ...]] = []
+
+# Precomputed search text: "terpene"/"cannabinoid" -> list of
+# (record, lowercased record JSON, {field: lowercased field JSON})
+_SEARCH_BLOBS: dict[str, list[tuple[dict[str, Any], str, dict[str, str]]]] = {}
+
+# Per-kind search buffer: NUL-joined record text and each record's start offset
+_SEARCH_BUFFERS: dict[str, tuple[str, list[int]]] = {}
+
+# Per-kind trigram inverted index: 3-character substring -> record positions
+_SEARCH_GRAMS_LEN = 3
+_SEARCH_TRIGRAMS: dict[str, dict[str, set[int]]] = {}
+
+# Serialized results kept for the most recent distinct search queries
+_SEARCH_RESPONSE_CACHE_SIZE = 256
+
+# Data files at least this large are parsed from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+# Serialized responses of read-only tools/resources: call key -> JSON text
+_RESPONSE_CACHE: dict[tuple[Any, ...], str] = {}
+
+# Single-file snapshot of every schema and reference data set, written after
+# each sync so startup can load everything in one read
+_SNAPSHOT_FILE = _PACKAGE_DIR / ".sync-snapshot.json"
+
+# Upstream ETags from the last successful sync: url -> etag
+_ETAG_FILE = _PACKAGE_DIR / ".sync-etags.json"
+_ETAG_CACHE: dict[str, str] = {}
+
 
 def _load_json(path: Path) -> dict[str, Any]:
-    """Read and parse a JSON file."""
-    return json.loads(path.read_text(encoding="utf-8"))
+    """Read and parse a JSON file.
+
+    Files of ``_MMAP_THRESHOLD`` bytes or more are parsed straight from a
+    read-only memory map instead of being copied into a bytes object
+    first.  Below that, setting up the mapping costs more than the copy.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object as indented JSON text for tool responses.
+
+    Tools must return ``str``: FastMCP passes strings through as text
+    content but JSON-encodes any other return value, so handing it the
+    ``bytes`` from orjson would double-encode the payload.  The decode
+    happens once per cached response rather than per call.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _memoize_response(fn: Callable[..., str]) -> Callable[..., str]:
+    """Cache a read-only function's serialized response until the next sync.
+
+    Keys on the function's qualified name and call arguments.  Exceptions
+    are not cached, so failing calls still reach the error handling.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        key = (fn.__qualname__, args, tuple(sorted(kwargs.items())))
+        if key not in _RESPONSE_CACHE:
+            _RESPONSE_CACHE[key] = fn(*args, **kwargs)
+        return _RESPONSE_CACHE[key]
+
+    return wrapper
 
 
+@functools.cache
 def _get_schema(name: str) -> dict[str, Any]:
-    """Return a cached schema by short name (e.g. 'strain')."""
+    """Return a cached schema by short name (e.g. 'strain').
+
+    The ``functools.cache`` layer serves repeat lookups without entering this
+    body; ``_SCHEMA_CACHE`` remains the store that sync and the snapshot
+    write into, so they must call ``_clear_loader_caches()`` afterwards.
+    """
     if name not in _SCHEMA_CACHE:
-        path = _SCHEMA_DIR / f"{name}.json"
-        if not path.exists():
+        path = _SCHEMA_FILES.get(name)
+        if path is None:
             raise FileNotFoundError(f"Schema not found: {name}")
         _SCHEMA_CACHE[name] = _load_json(path)
     return _SCHEMA_CACHE[name]
 
 
+@functools.cache
 def _get_reference(name: str) -> dict[str, Any]:
-    """Return cached reference data by short name (e.g. 'terpene-library')."""
+    """Return cached reference data by short name (e.g. 'terpene-library').
+
+    Memoized like ``_get_schema`` on top of ``_REFERENCE_CACHE``.
+    """
     if name not in _REFERENCE_CACHE:
-        path = _REFERENCE_DIR / f"{name}.json"
-        if not path.exists():
+        path = _REFERENCE_FILES.get(name)
+        if path is None:
             raise FileNotFoundError(f"Reference data not found: {name}")
         _REFERENCE_CACHE[name] = _load_json(path)
+        _reindex_reference(name)
     return _REFERENCE_CACHE[name]
 
 
+def _clear_loader_caches() -> None:
+    """Drop memoized loader results after the backing caches change."""
+    _get_schema.cache_clear()
+    _get_reference.cache_clear()
+
+
+def _build_index(
+    index: dict[str, dict[str, Any]],
+    records: list[dict[str, Any]],
+    *fields: str,
+    casefold: bool = False,
+    alias_fields: tuple[str, ...] = (),
+) -> None:
+    """Rebuild ``index`` mapping each record's field values to the record.
+
+    The first record wins on duplicate keys, matching a linear scan.
+    ``alias_fields`` hold lists of alternative names; they are indexed
+    after every primary field so an alias never shadows a real name.
+    """
+    index.clear()
+    for record in records:
+        for field in fields:
+            key = record.get(field)
+            if key:
+                index.setdefault(key.casefold() if casefold else key, record)
+    for record in records:
+        for field in alias_fields:
+            for key in record.get(field) or ():
+                if key:
+                    index.setdefault(key.casefold() if casefold else key, record)
+
+
+def _index_search(kind: str, records: list[dict[str, Any]]) -> None:
+    """Precompute the lowercased JSON text searched for each record.
+
+    Two structures are built over those texts.  A trigram inverted index
+    narrows queries of three or more characters to the few records that
+    contain every trigram of the query.  For shorter queries, the texts
+    are joined with NUL separators into one buffer so a query is a handful
+    of ``str.find`` calls; JSON text never contains a raw NUL, so matches
+    cannot span records.
+    """
+    entries = [
+        (
+            record,
+            orjson.dumps(record).decode().lower(),
+            {key: orjson.dumps(val).decode().lower() for key, val in record.items()},
+        )
+        for record in records
+    ]
+    offsets: list[int] = []
+    start = 0
+    for _, blob, _ in entries:
+        offsets.append(start)
+        start += len(blob) + 1
+    trigrams: dict[str, set[int]] = {}
+    for i, (_, blob, _) in enumerate(entries):
+        for j in range(len(blob) - _SEARCH_GRAMS_LEN + 1):
+            trigrams.setdefault(blob[j : j + _SEARCH_GRAMS_LEN], set()).add(i)
+    _SEARCH_BLOBS[kind] = entries
+    _SEARCH_BUFFERS[kind] = ("\x00".join(blob for _, blob, _ in entries), offsets)
+    _SEARCH_TRIGRAMS[kind] = trigrams
+
+
+def _search_hits(kind: str, query: str) -> list[tuple[dict[str, Any], str, dict[str, str]]]:
+    """Return the search entries of ``kind`` whose text contains ``query``."""
+    entries = _SEARCH_BLOBS[kind]
+    buffer, offsets = _SEARCH_BUFFERS[kind]
+    if not entries or "\x00" in query:
+        return []
+
+    if len(query) >= _SEARCH_GRAMS_LEN:
+        # Candidates contain every trigram of the query; confirm each with
+        # a substring test since the trigrams may occur apart.
+        postings = _SEARCH_TRIGRAMS[kind]
+        grams = {query[j : j + _SEARCH_GRAMS_LEN] for j in range(len(query) - _SEARCH_GRAMS_LEN + 1)}
+        candidates: set[int] | None = None
+        for gram in sorted(grams, key=lambda g: len(postings.get(g, ()))):
+            ids = postings.get(gram)
+            if not ids:
+                return []
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        return [entries[i] for i in sorted(candidates or ()) if query in entries[i][1]]
+
+    hits = []
+    pos = buffer.find(query)
+    while pos != -1:
+        i = bisect.bisect_right(offsets, pos) - 1
+        hits.append(entries[i])
+        if i + 1 == len(offsets):
+            break
+        pos = buffer.find(query, offsets[i + 1])
+    return hits
+
+
+def _terpene_row(terpene: dict[str, Any]) -> tuple[Any, ...]:
+    """Extract a terpene's ``list_terpenes`` summary fields as stored."""
+    return (
+        terpene.get("id"),
+        terpene.get("name"),
+        terpene.get("casNumber"),
+        terpene.get("category"),
+        terpene.get("aroma", []),
+        terpene.get("boilingPoint"),
+    )
+
+
+def _cannabinoid_row(cannabinoid: dict[str, Any]) -> tuple[Any, ...]:
+    """Extract a cannabinoid's ``list_cannabinoids`` summary fields as stored."""
+    return (
+        cannabinoid.get("id"),
+        cannabinoid.get("name"),
+        cannabinoid.get("fullName"),
+        cannabinoid.get("psychoactive"),
+        cannabinoid.get("color"),
+        cannabinoid.get("effects", []),
+    )
+
+
+def _reindex_reference(name: str) -> None:
+    """Rebuild the lookup indexes derived from a cached reference data set."""
+    data = _REFERENCE_CACHE[name]
+    if name == "terpene-library":
+        terpenes = data.get("terpenes", [])
+        _build_index(_TERPENE_BY_ID, terpenes, "id")
+        _build_index(_TERPENE_BY_NAME, terpenes, "name", casefold=True, alias_fields=("synonyms",))
+        _index_search("terpene", terpenes)
+        _TERPENE_ROWS[:] = [_terpene_row(t) for t in terpenes]
+        _AVAILABLE_PREVIEW[name] = ", ".join([t["name"] for t in terpenes if "name" in t][:10])
+    elif name == "cannabinoid-library":
+        cannabinoids = data.get("cannabinoids", [])
+        _build_index(_CANNABINOID_BY_ID, cannabinoids, "id")
+        _build_index(_CANNABINOID_BY_NAME, cannabinoids, "name", "fullName", casefold=True)
+        _index_search("cannabinoid", cannabinoids)
+        _CANNABINOID_ROWS[:] = [_cannabinoid_row(c) for c in cannabinoids]
+        _AVAILABLE_PREVIEW[name] = ", ".join(
+            [f"{c['name']} ({c.get('fullName', '')})" for c in cannabinoids if "name" in c][:10]
+        )
+    elif name == "terpene-colors":
+        colors = data.get("colors", [])
+        _build_index(_TERPENE_COLOR_BY_NAME, colors, "terpene", casefold=True)
+        _AVAILABLE_PREVIEW[name] = ", ".join([c["terpene"] for c in colors if "terpene" in c][:10])
+
+
+def _rescan_names() -> None:
+    """Refresh the schema and reference file maps and name lists from disk.
+
+    The loaders resolve names through these maps, so a lookup never builds
+    a path or touches the filesystem to reject an unknown name.
+    """
+    _SCHEMA_FILES.clear()
+    _SCHEMA_FILES.update((p.stem, p) for p in _SCHEMA_DIR.glob("*.json"))
+    _REFERENCE_FILES.clear()
+    _REFERENCE_FILES.update((p.stem, p) for p in _REFERENCE_DIR.glob("*.json"))
+    _SCHEMA_NAMES[:] = sorted(_SCHEMA_FILES)
+    _REFERENCE_NAMES[:] = sorted(_REFERENCE_FILES)
+
+
 def _all_schema_names() -> list[str]:
     """List available schema file stems."""
-    return sorted(p.stem for p in _SCHEMA_DIR.glob("*.json"))
+    return _SCHEMA_NAMES
 
 
 def _all_reference_names() -> list[str]:
     """List available reference data file stems."""
-    return sorted(p.stem for p in _REFERENCE_DIR.glob("*.json"))
+    return _REFERENCE_NAMES
 
 
-def sync_schemas_from_github() -> dict[str, Any]:
-    """Fetch latest schemas and reference data from upstream GitHub repos.
+def _get_registry() -> referencing.Registry:
+    """Return the registry of all schemas, keyed by their ``$id``.
 
-    Pulls from Acidni-LLC/cdes-spec (schemas) and
-    Acidni-LLC/cdes-reference-data (terpene/cannabinoid libraries).
-    Downloaded files are cached in memory and persisted to disk so the
-    bundled copy stays current across container restarts.
+    The registry is crawled up front so subresources and anchors are
+    indexed here rather than on the first ``$ref`` a validation follows.
+    """
+    global _REGISTRY  # noqa: PLW0603
+    if _REGISTRY is None:
+        resources: list[tuple[str, referencing.Resource]] = []
+        for name in _all_schema_names():
+            s = _get_schema(name)
+            if "$id" in s:
+                resources.append((s["$id"], referencing.Resource.from_contents(s)))
+        _REGISTRY = referencing.Registry().with_resources(resources).crawl()
+    return _REGISTRY
+
+
+def _get_draft_validator(name: str, *, check_formats: bool = False) -> Validator:
+    """Return the cached jsonschema validator for a schema.
+
+    The validator class comes from the schema's ``$schema`` via
+    ``validator_for``.  ``format`` keywords are only asserted when
+    ``check_formats`` is set.  Raises ``jsonschema.SchemaError`` if the
+    schema itself is invalid.
+    """
+    cache = _FORMAT_VALIDATOR_CACHE if check_formats else _DRAFT_VALIDATOR_CACHE
+    if name not in cache:
+        schema = _get_schema(name)
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        cache[name] = cls(
+            schema,
+            registry=_get_registry(),
+            format_checker=cls.FORMAT_CHECKER if check_formats else None,
+        )
+    return cache[name]
+
+
+def _validate(name: str, data: Any, *, check_formats: bool = False) -> dict[str, Any]:
+    """Validate ``data`` against a schema and return the result summary."""
+    validator = _get_draft_validator(name, check_formats=check_formats)
+    errors = sorted(validator.iter_errors(data), key=lambda e: list(e.absolute_path))
+
+    error_messages = []
+    for err in errors:
+        path = ".".join(str(p) for p in err.absolute_path) or "(root)"
+        error_messages.append(
+            {
+                "path": path,
+                "message": err.message,
+                "schemaPath": ".".join(str(p) for p in err.absolute_schema_path),
+            }
+        )
+
+    return {
+        "valid": len(error_messages) == 0,
+        "schemaName": name,
+        "errorCount": len(error_messages),
+        "errors": error_messages,
+    }
+
+
+@functools.cache
+def _valid_response(name: str) -> str:
+    """Serialized ``validate_data`` response for data that passed ``name``."""
+    return _dumps({"valid": True, "schemaName": name, "errorCount": 0, "errors": []})
+
+
+def _rebuild_validators() -> None:
+    """Rebuild the registry and validators for every available schema."""
+    global _REGISTRY  # noqa: PLW0603
+    _REGISTRY = None
+    _DRAFT_VALIDATOR_CACHE.clear()
+    _FORMAT_VALIDATOR_CACHE.clear()
+    for name in _all_schema_names():
+        try:
+            _get_draft_validator(name)
+        except jsonschema.SchemaError as exc:
+            # Left uncached so validate_data reports it per call.
+            logger.warning("Schema %s is not a valid JSON Schema: %s", name, exc.message)
+
+
+def _sync_targets() -> list[tuple[str, str, str, Path]]:
+    """List ``(kind, name, url, path)`` for every upstream file to sync."""
+    targets = [
+        (
+            "Schema",
+            name,
+            f"{_GITHUB_RAW_BASE}/cdes-spec/main/schemas/v1/{name}.json",
+            _SCHEMA_DIR / f"{name}.json",
+        )
+        for name in _GITHUB_SCHEMA_FILES
+    ]
+    targets.extend(
+        (
+            "Reference",
+            ref_name,
+            f"{_GITHUB_RAW_BASE}/cdes-reference-data/main/{subdir}/{filename}",
+            _REFERENCE_DIR / f"{ref_name}.json",
+        )
+        for ref_name, (subdir, filename) in _GITHUB_REFERENCE_MAP.items()
+    )
+    return targets
+
+
+def _source_fingerprint() -> dict[str, list[int]]:
+    """Size and mtime of every data file on disk, keyed by relative path."""
+    fingerprint: dict[str, list[int]] = {}
+    for path in sorted([*_SCHEMA_DIR.glob("*.json"), *_REFERENCE_DIR.glob("*.json")]):
+        stat = path.stat()
+        fingerprint[f"{path.parent.name}/{path.name}"] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def _save_snapshot() -> None:
+    """Write every schema and reference data set to the snapshot file.
+
+    The snapshot is written to a temporary file and renamed into place,
+    so a concurrent or interrupted start never reads a partial file.
+    """
+    tmp = _SNAPSHOT_FILE.with_suffix(".tmp")
+    try:
+        snapshot = {
+            "sources": _source_fingerprint(),
+            "schemas": {name: _get_schema(name) for name in _all_schema_names()},
+            "references": {name: _get_reference(name) for name in _all_reference_names()},
+        }
+        tmp.write_bytes(orjson.dumps(snapshot))
+        tmp.replace(_SNAPSHOT_FILE)
+    except (OSError, orjson.JSONDecodeError) as exc:
+        logger.warning("Could not write cache snapshot %s: %s", _SNAPSHOT_FILE, exc)
+
+
+def _load_snapshot() -> None:
+    """Populate the schema and reference caches from the snapshot file.
+
+    The snapshot records the size and mtime of every data file it was
+    built from.  It is skipped when missing or when any file was added,
+    removed, or rewritten since (e.g. an image rebuilt with fresh
+    schemas); files then load individually on demand.
+    """
+    try:
+        snapshot = _load_json(_SNAPSHOT_FILE)
+        if snapshot.get("sources") != _source_fingerprint():
+            return
+    except FileNotFoundError:
+        return
+    except (OSError, orjson.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable cache snapshot %s: %s", _SNAPSHOT_FILE, exc)
+        return
+
+    schemas = snapshot.get("schemas", {})
+    references = snapshot.get("references", {})
+    if sorted(schemas) != _all_schema_names() or sorted(references) != _all_reference_names():
+        return
+    _SCHEMA_CACHE.update(schemas)
+    _REFERENCE_CACHE.update(references)
+    _clear_loader_caches()
+    for name in references:
+        _reindex_reference(name)
+
+
+def _load_etags() -> None:
+    """Populate the ETag cache from disk if it is still empty."""
+    if _ETAG_CACHE or not _ETAG_FILE.exists():
+        return
+    try:
+        _ETAG_CACHE.update(_load_json(_ETAG_FILE))
+    except (OSError, orjson.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable ETag cache %s: %s", _ETAG_FILE, exc)
+
+
+def _save_etags() -> None:
+    """Persist the ETag cache next to the synced files."""
+    try:
+        _ETAG_FILE.write_bytes(orjson.dumps(_ETAG_CACHE, option=orjson.OPT_INDENT_2))
+    except OSError as exc:
+        logger.warning("Could not persist ETag cache %s: %s", _ETAG_FILE, exc)
+
+
+def _conditional_headers(url: str, path: Path) -> dict[str, str]:
+    """Return ``If-None-Match`` for a URL whose file is already on disk."""
+    etag = _ETAG_CACHE.get(url)
+    if etag and path.exists():
+        return {"If-None-Match": etag}
+    return {}
+
+
+def _github_client() -> httpx.AsyncClient:
+    """Create the HTTP/2 client used for a GitHub sync.
+
+    A client is created per sync rather than shared at module level because
+    each sync runs in its own event loop, and pooled connections cannot be
+    reused across loops.
+    """
+    return httpx.AsyncClient(
+        timeout=_GITHUB_TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=_GITHUB_LIMITS,
+            retries=_GITHUB_RETRIES,
+        ),
+    )
+
+
+def _persist_file(path: Path, raw: bytes) -> None:
+    """Write a synced document to disk exactly as downloaded."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(raw)
+
+
+async def _fetch_file(client: httpx.AsyncClient, url: str, path: Path) -> tuple[Any, OSError | None]:
+    """Download one upstream file and persist it in a worker thread.
+
+    The payload is parsed once to validate it and persisted as the raw
+    downloaded bytes, so upstream formatting is kept without a
+    re-serialize pass.  Writing off the event loop lets disk I/O for one
+    file overlap the downloads still in flight.
+
+    Returns ``(document, write_error)``.  ``document`` is ``None`` if
+    upstream answered 304 Not Modified.  A failed write (e.g. a read-only
+    install directory) is returned as ``write_error`` rather than raised,
+    so the document still reaches the in-memory caches; the ETag is only
+    recorded once the file is on disk.  Raises ``httpx.HTTPStatusError``
+    for any other non-success response.
+    """
+    resp = await client.get(url, headers=_conditional_headers(url, path))
+    if resp.status_code == httpx.codes.NOT_MODIFIED:
+        return None, None
+    resp.raise_for_status()
+    raw = resp.content
+    data = orjson.loads(raw)
+    try:
+        await anyio.to_thread.run_sync(_persist_file, path, raw)
+    except OSError as exc:
+        return data, exc
+    if etag := resp.headers.get("etag"):
+        _ETAG_CACHE[url] = etag
+    return data, None
+
+
+def _describe_fetch_error(exc: BaseException) -> str:
+    """Summarize a failed download for the sync report."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"HTTP {exc.response.status_code}"
+    return str(exc)
+
+
+async def _fetch_one(
+    client: httpx.AsyncClient,
+    semaphore: anyio.Semaphore,
+    url: str,
+    path: Path,
+    outcomes: dict[str, Any],
+) -> None:
+    """Run ``_fetch_file`` under the semaphore, recording result or error."""
+    async with semaphore:
+        try:
+            outcomes[url] = await _fetch_file(client, url, path)
+        except Exception as exc:  # noqa: BLE001
+            outcomes[url] = exc
+
+
+async def _sync_async() -> dict[str, Any]:
+    """Fetch every upstream file concurrently and update caches and disk.
+
+    At most ``_GITHUB_MAX_CONCURRENCY`` requests are in flight at once so
+    the sync stays polite to GitHub as the file lists grow.
     """
     global _last_sync  # noqa: PLW0603
     errors: list[str] = []
-    schemas_updated = 0
-    refs_updated = 0
+    updated = {"Schema": 0, "Reference": 0}
+    skipped = 0
+    caches = {"Schema": _SCHEMA_CACHE, "Reference": _REFERENCE_CACHE}
+    targets = _sync_targets()
+    _load_etags()
 
+    outcomes: dict[str, Any] = {}
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            # -- schemas ------------------------------------------------
-            for name in _GITHUB_SCHEMA_FILES:
-                url = f"{_GITHUB_RAW_BASE}/cdes-spec/main/schemas/v1/{name}.json"
-                try:
-                    resp = client.get(url)
-                    if resp.is_success:
-                        data = resp.json()
-                        _SCHEMA_CACHE[name] = data
-                        path = _SCHEMA_DIR / f"{name}.json"
-                        path.parent.mkdir(parents=True, exist_ok=True)
-                        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-                        schemas_updated += 1
-                    else:
-                        errors.append(f"Schema {name}: HTTP {resp.status_code}")
-                except Exception as exc:  # noqa: BLE001
-                    errors.append(f"Schema {name}: {exc}")
-
-            # -- reference data -----------------------------------------
-            for ref_name, (subdir, filename) in _GITHUB_REFERENCE_MAP.items():
-                url = f"{_GITHUB_RAW_BASE}/cdes-reference-data/main/{subdir}/{filename}"
-                try:
-                    resp = client.get(url)
-                    if resp.is_success:
-                        data = resp.json()
-                        _REFERENCE_CACHE[ref_name] = data
-                        path = _REFERENCE_DIR / f"{ref_name}.json"
-                        path.parent.mkdir(parents=True, exist_ok=True)
-                        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-                        refs_updated += 1
-                    else:
-                        errors.append(f"Reference {ref_name}: HTTP {resp.status_code}")
-                except Exception as exc:  # noqa: BLE001
-                    errors.append(f"Reference {ref_name}: {exc}")
+        semaphore = anyio.Semaphore(_GITHUB_MAX_CONCURRENCY)
+        async with _github_client() as client, anyio.create_task_group() as tg:
+            for _, _, url, path in targets:
+                tg.start_soon(_fetch_one, client, semaphore, url, path, outcomes)
     except Exception as exc:  # noqa: BLE001
         errors.append(f"GitHub sync failed: {exc}")
-
+    else:
+        for kind, name, url, _path in targets:
+            result = outcomes[url]
+            if isinstance(result, BaseException):
+                errors.append(f"{kind} {name}: {_describe_fetch_error(result)}")
+            elif result[0] is None:
+                skipped += 1
+            else:
+                data, write_error = result
+                if write_error is not None:
+                    errors.append(f"{kind} {name}: not persisted: {write_error}")
+                try:
+                    caches[kind][name] = data
+                    if kind == "Reference":
+                        _reindex_reference(name)
+                except Exception as exc:  # noqa: BLE001
+                    errors.append(f"{kind} {name}: {exc}")
+                    continue
+                updated[kind] += 1
+        _clear_loader_caches()
+        _save_etags()
+
+    _rescan_names()
+    _rebuild_validators()
+    _RESPONSE_CACHE.clear()
+    _search_response.cache_clear()
+    _warm_responses()
+    _save_snapshot()
     _last_sync = datetime.now(tz=UTC)
+    _refresh_health()
 
     summary: dict[str, Any] = {
-        "schemas_updated": schemas_updated,
-        "references_updated": refs_updated,
+        "schemas_updated": updated["Schema"],
+        "references_updated": updated["Reference"],
+        "skipped": skipped,
         "errors": errors,
         "synced_at": _last_sync.isoformat(),
     }
@@ -216,22 +769,48 @@ def sync_schemas_from_github() -> dict[str, Any]:
         logger.warning("GitHub sync completed with errors: %s", errors)
     else:
         logger.info(
-            "GitHub sync complete: %d schemas, %d references",
-            schemas_updated,
-            refs_updated,
+            "GitHub sync complete: %d schemas, %d references, %d unchanged",
+            updated["Schema"],
+            updated["Reference"],
+            skipped,
         )
 
     return summary
 
 
+def sync_schemas_from_github() -> dict[str, Any]:
+    """Fetch latest schemas and reference data from upstream GitHub repos.
+
+    Pulls from Acidni-LLC/cdes-spec (schemas) and
+    Acidni-LLC/cdes-reference-data (terpene/cannabinoid libraries).
+    All files are requested concurrently, so a sync costs roughly one
+    round trip instead of one per file.  Requests carry the ETag from the
+    previous sync; files answered with 304 Not Modified are counted as
+    ``skipped`` and left untouched.  Downloaded files are cached in
+    memory and persisted to disk so the bundled copy stays current across
+    container restarts.
+    """
+    return anyio.run(_sync_async)
+
+
+_rescan_names()
+_load_snapshot()
+_rebuild_validators()
+
+
 # ---------------------------------------------------------------------------
 # Health endpoint
 # ---------------------------------------------------------------------------
 
 
-async def _health_endpoint(request: Request) -> JSONResponse:  # noqa: ARG001
-    """Health check for Azure Container Apps probes."""
-    return JSONResponse(
+def _refresh_health() -> None:
+    """Rebuild the serialized health payload.
+
+    Its contents only change when a sync runs, so it is built at startup
+    and after each sync rather than per probe.
+    """
+    global _HEALTH_BYTES  # noqa: PLW0603
+    _HEALTH_BYTES = orjson.dumps(
         {
             "status": "healthy",
             "service": "cdes-mcp-server",
@@ -244,12 +823,21 @@ async def _health_endpoint(request: Request) -> JSONResponse:  # noqa: ARG001
     )
 
 
+async def _health_endpoint(request: Request) -> Response:  # noqa: ARG001
+    """Health check for Azure Container Apps probes."""
+    return Response(_HEALTH_BYTES, media_type="application/json")
+
+
+_refresh_health()
+
+
 # ---------------------------------------------------------------------------
 # MCP Resources — schemas
 # ---------------------------------------------------------------------------
 
 
 @mcp.resource("cdes://schemas/v1/{name}")
+@_memoize_response
 def schema_resource(name: str) -> str:
     """Return a CDES v1 JSON schema as a resource.
 
@@ -257,17 +845,18 @@ def schema_resource(name: str) -> str:
     terpene, coa, rating, rating-aggregate.
     """
     schema = _get_schema(name)
-    return json.dumps(schema, indent=2)
+    return _dumps(schema)
 
 
 @mcp.resource("cdes://reference/{name}")
+@_memoize_response
 def reference_resource(name: str) -> str:
     """Return CDES reference data as a resource.
 
     Available: terpene-library, cannabinoid-library, terpene-colors.
     """
     data = _get_reference(name)
-    return json.dumps(data, indent=2)
+    return _dumps(data)
 
 
 # ---------------------------------------------------------------------------
@@ -275,6 +864,25 @@ def reference_resource(name: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@_memoize_response
+def _list_schemas_json() -> str:
+    """Serialized ``list_schemas`` result, memoized until the next sync."""
+    result = []
+    for name in _all_schema_names():
+        schema = _get_schema(name)
+        result.append(
+            {
+                "name": name,
+                "title": schema.get("title", name),
+                "description": schema.get("description", ""),
+                "schemaId": schema.get("$id", ""),
+                "required": schema.get("required", []),
+                "propertyCount": len(schema.get("properties", {})),
+            }
+        )
+    return _dumps(result)
+
+
 @mcp.tool()
 def list_schemas() -> str:
     """List all available CDES v1 schemas with their titles and descriptions.
@@ -282,23 +890,7 @@ def list_schemas() -> str:
     Returns a JSON array of objects with name, title, description, and
     required fields for each schema.
     """
-    def _impl() -> str:
-        result = []
-        for name in _all_schema_names():
-            schema = _get_schema(name)
-            result.append(
-                {
-                    "name": name,
-                    "title": schema.get("title", name),
-                    "description": schema.get("description", ""),
-                    "schemaId": schema.get("$id", ""),
-                    "required": schema.get("required", []),
-                    "propertyCount": len(schema.get("properties", {})),
-                }
-            )
-        return json.dumps(result, indent=2)
-
-    return safe_tool_call(_impl, tool_name="list_schemas")
+    return safe_tool_call(_list_schemas_json, tool_name="list_schemas")
 
 
 @mcp.tool()
@@ -312,57 +904,27 @@ def get_schema(name: str) -> str:
     Returns the complete JSON Schema (Draft 2020-12) document.
     """
     def _impl() -> str:
-        schema = _get_schema(name)
-        return json.dumps(schema, indent=2)
+        # Same document as the schema resource; reuse its cached text.
+        return schema_resource(name)
 
     return safe_tool_call(_impl, tool_name="get_schema", context=f"name={name}")
 
 
 @mcp.tool()
-def validate_data(schema_name: str, data: dict[str, Any]) -> str:
+def validate_data(schema_name: str, data: dict[str, Any], check_formats: bool = False) -> str:
     """Validate a data object against a CDES v1 schema.
 
     Args:
         schema_name: The schema to validate against (e.g. 'strain', 'coa').
         data: The JSON object to validate.
+        check_formats: Also assert ``format`` keywords (dates, URIs, ...).
 
     Returns a JSON object with 'valid' (bool) and 'errors' (list of
     error messages if invalid).
     """
     def _impl() -> str:
-        schema = _get_schema(schema_name)
-
-        # Build a referencing.Registry so $ref between CDES schemas resolves
-        resources: list[tuple[str, referencing.Resource]] = []
-        for sn in _all_schema_names():
-            s = _get_schema(sn)
-            if "$id" in s:
-                resources.append((s["$id"], referencing.Resource.from_contents(s)))
-        registry = referencing.Registry().with_resources(resources)
-
-        validator = jsonschema.Draft202012Validator(schema, registry=registry)
-        errors = sorted(validator.iter_errors(data), key=lambda e: list(e.absolute_path))
-
-        error_messages = []
-        for err in errors:
-            path = ".".join(str(p) for p in err.absolute_path) or "(root)"
-            error_messages.append(
-                {
-                    "path": path,
-                    "message": err.message,
-                    "schemaPath": ".".join(str(p) for p in err.absolute_schema_path),
-                }
-            )
-
-        return json.dumps(
-            {
-                "valid": len(error_messages) == 0,
-                "schemaName": schema_name,
-                "errorCount": len(error_messages),
-                "errors": error_messages,
-            },
-            indent=2,
-        )
+        result = _validate(schema_name, data, check_formats=check_formats)
+        return _valid_response(schema_name) if result["valid"] else _dumps(result)
 
     return safe_tool_call(_impl, tool_name="validate_data", context=f"schema={schema_name}")
 
@@ -372,27 +934,25 @@ def get_terpene_info(terpene_id: str | None = None, name: str | None = None) ->
     """Look up detailed information about a specific terpene.
 
     Provide either the terpene ID (e.g. 'terpene:myrcene') or the common
-    name (e.g. 'Myrcene'). Returns the full terpene record from the
-    reference library including aroma, effects, boiling point, and
-    natural sources.
+    name (e.g. 'Myrcene'); listed synonyms are accepted as names too.
+    Returns the full terpene record from the reference library including
+    aroma, effects, boiling point, and natural sources.
 
     Args:
         terpene_id: CDES terpene identifier (e.g. 'terpene:limonene').
-        name: Common name of the terpene (case-insensitive).
+        name: Common name or synonym of the terpene (case-insensitive).
     """
     def _impl() -> str:
-        lib = _get_reference("terpene-library")
-        for t in lib.get("terpenes", []):
-            if terpene_id and t.get("id") == terpene_id:
-                return json.dumps(t, indent=2)
-            if name and t.get("name", "").lower() == name.lower():
-                return json.dumps(t, indent=2)
-
-        available = [t["name"] for t in lib.get("terpenes", [])]
+        _get_reference("terpene-library")
+        terpene = _TERPENE_BY_ID.get(terpene_id) or _TERPENE_BY_NAME.get(name.casefold() if name else "")
+        if terpene is not None:
+            return _dumps(terpene)
+
+        available = _AVAILABLE_PREVIEW["terpene-library"]
         return problem_json(
             status=404,
             title="Terpene Not Found",
-            detail=f"No terpene matching id={terpene_id}, name={name}. Available: {', '.join(available[:10])}",
+            detail=f"No terpene matching id={terpene_id}, name={name}. Available: {available}",
             code="TERPENE_NOT_FOUND",
             instance="/mcp/tool/get_terpene_info",
         )
@@ -420,18 +980,17 @@ def get_cannabinoid_info(
         name: Common name or abbreviation (case-insensitive).
     """
     def _impl() -> str:
-        lib = _get_reference("cannabinoid-library")
-        for c in lib.get("cannabinoids", []):
-            if cannabinoid_id and c.get("id") == cannabinoid_id:
-                return json.dumps(c, indent=2)
-            if name and (c.get("name", "").lower() == name.lower() or c.get("fullName", "").lower() == name.lower()):
-                return json.dumps(c, indent=2)
-
-        available = [f"{c['name']} ({c.get('fullName', '')})" for c in lib.get("cannabinoids", [])]
+        _get_reference("cannabinoid-library")
+        key = name.casefold() if name else ""
+        cannabinoid = _CANNABINOID_BY_ID.get(cannabinoid_id) or _CANNABINOID_BY_NAME.get(key)
+        if cannabinoid is not None:
+            return _dumps(cannabinoid)
+
+        available = _AVAILABLE_PREVIEW["cannabinoid-library"]
         return problem_json(
             status=404,
             title="Cannabinoid Not Found",
-            detail=f"No cannabinoid matching id={cannabinoid_id}, name={name}. Available: {', '.join(available[:10])}",
+            detail=f"No cannabinoid matching id={cannabinoid_id}, name={name}. Available: {available}",
             code="CANNABINOID_NOT_FOUND",
             instance="/mcp/tool/get_cannabinoid_info",
         )
@@ -454,16 +1013,16 @@ def lookup_terpene_color(terpene_name: str) -> str:
         terpene_name: Terpene key name (e.g. 'myrcene', 'limonene').
     """
     def _impl() -> str:
-        colors = _get_reference("terpene-colors")
-        for entry in colors.get("colors", []):
-            if entry.get("terpene", "").lower() == terpene_name.lower():
-                return json.dumps(entry, indent=2)
+        _get_reference("terpene-colors")
+        entry = _TERPENE_COLOR_BY_NAME.get(terpene_name.casefold())
+        if entry is not None:
+            return _dumps(entry)
 
-        available = [c["terpene"] for c in colors.get("colors", [])]
+        available = _AVAILABLE_PREVIEW["terpene-colors"]
         return problem_json(
             status=404,
             title="Terpene Color Not Found",
-            detail=f"No color mapping for '{terpene_name}'. Available: {', '.join(available[:10])}",
+            detail=f"No color mapping for '{terpene_name}'. Available: {available}",
             code="TERPENE_COLOR_NOT_FOUND",
             instance="/mcp/tool/lookup_terpene_color",
         )
@@ -475,6 +1034,24 @@ def lookup_terpene_color(terpene_name: str) -> str:
     )
 
 
+@_memoize_response
+def _list_terpenes_json() -> str:
+    """Serialized ``list_terpenes`` result, memoized until the next sync."""
+    _get_reference("terpene-library")
+    result = [
+        {
+            "id": terpene_id,
+            "name": name,
+            "casNumber": cas_number,
+            "category": category,
+            "aroma": aroma,
+            "boilingPoint": boiling_point,
+        }
+        for terpene_id, name, cas_number, category, aroma, boiling_point in _TERPENE_ROWS
+    ]
+    return _dumps(result)
+
+
 @mcp.tool()
 def list_terpenes() -> str:
     """List all terpenes in the CDES reference library.
@@ -482,22 +1059,25 @@ def list_terpenes() -> str:
     Returns a summary array with id, name, category, aroma, and boiling
     point for each terpene.
     """
-    def _impl() -> str:
-        lib = _get_reference("terpene-library")
-        result = [
-            {
-                "id": t.get("id"),
-                "name": t.get("name"),
-                "casNumber": t.get("casNumber"),
-                "category": t.get("category"),
-                "aroma": t.get("aroma", []),
-                "boilingPoint": t.get("boilingPoint"),
-            }
-            for t in lib.get("terpenes", [])
-        ]
-        return json.dumps(result, indent=2)
+    return safe_tool_call(_list_terpenes_json, tool_name="list_terpenes")
 
-    return safe_tool_call(_impl, tool_name="list_terpenes")
+
+@_memoize_response
+def _list_cannabinoids_json() -> str:
+    """Serialized ``list_cannabinoids`` result, memoized until the next sync."""
+    _get_reference("cannabinoid-library")
+    result = [
+        {
+            "id": cannabinoid_id,
+            "name": name,
+            "fullName": full_name,
+            "psychoactive": psychoactive,
+            "color": color,
+            "effects": effects,
+        }
+        for cannabinoid_id, name, full_name, psychoactive, color, effects in _CANNABINOID_ROWS
+    ]
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -507,22 +1087,7 @@ def list_cannabinoids() -> str:
     Returns a summary array with id, name, psychoactive status, color,
     and primary effects for each cannabinoid.
     """
-    def _impl() -> str:
-        lib = _get_reference("cannabinoid-library")
-        result = [
-            {
-                "id": c.get("id"),
-                "name": c.get("name"),
-                "fullName": c.get("fullName"),
-                "psychoactive": c.get("psychoactive"),
-                "color": c.get("color"),
-                "effects": c.get("effects", []),
-            }
-            for c in lib.get("cannabinoids", [])
-        ]
-        return json.dumps(result, indent=2)
-
-    return safe_tool_call(_impl, tool_name="list_cannabinoids")
+    return safe_tool_call(_list_cannabinoids_json, tool_name="list_cannabinoids")
 
 
 @mcp.tool()
@@ -536,60 +1101,130 @@ def search_reference_data(query: str) -> str:
         query: The search term (e.g. 'citrus', 'pain', 'anti-inflammatory').
     """
     def _impl() -> str:
-        q = query.lower()
-        results: list[dict[str, Any]] = []
-
-        # Search terpenes
-        lib = _get_reference("terpene-library")
-        for t in lib.get("terpenes", []):
-            searchable = json.dumps(t).lower()
-            if q in searchable:
-                results.append(
-                    {
-                        "type": "terpene",
-                        "id": t.get("id"),
-                        "name": t.get("name"),
-                        "matchContext": _extract_match_context(t, q),
-                    }
-                )
-
-        # Search cannabinoids
-        clib = _get_reference("cannabinoid-library")
-        for c in clib.get("cannabinoids", []):
-            searchable = json.dumps(c).lower()
-            if q in searchable:
-                results.append(
-                    {
-                        "type": "cannabinoid",
-                        "id": c.get("id"),
-                        "name": c.get("name"),
-                        "matchContext": _extract_match_context(c, q),
-                    }
-                )
-
-        return json.dumps(
+        return _search_response(query)
+
+    return safe_tool_call(_impl, tool_name="search_reference_data", context=f"query={query}")
+
+
+@functools.lru_cache(maxsize=_SEARCH_RESPONSE_CACHE_SIZE)
+def _search_response(query: str) -> str:
+    """Serialize the search results for ``query``.
+
+    Results only change when a sync runs, which clears this cache.  It is
+    bounded because queries are arbitrary client input.
+    """
+    q = query.lower()
+    results: list[dict[str, Any]] = []
+
+    # Search terpenes
+    _get_reference("terpene-library")
+    for t, _, fields in _search_hits("terpene", q):
+        results.append(
             {
-                "query": query,
-                "resultCount": len(results),
-                "results": results,
-            },
-            indent=2,
+                "type": "terpene",
+                "id": t.get("id"),
+                "name": t.get("name"),
+                "matchContext": _extract_match_context(fields, q),
+            }
         )
 
-    return safe_tool_call(_impl, tool_name="search_reference_data", context=f"query={query}")
+    # Search cannabinoids
+    _get_reference("cannabinoid-library")
+    for c, _, fields in _search_hits("cannabinoid", q):
+        results.append(
+            {
+                "type": "cannabinoid",
+                "id": c.get("id"),
+                "name": c.get("name"),
+                "matchContext": _extract_match_context(fields, q),
+            }
+        )
+
+    return _dumps(
+        {
+            "query": query,
+            "resultCount": len(results),
+            "results": results,
+        }
+    )
+
 
+def _extract_match_context(fields: dict[str, str], query: str) -> str:
+    """Find which fields match the query for context.
 
-def _extract_match_context(obj: dict[str, Any], query: str) -> str:
-    """Find which fields match the query for context."""
+    ``fields`` maps each field name to its precomputed lowercased JSON.
+    """
     q = query.lower()
-    matches = []
-    for key, val in obj.items():
-        val_str = json.dumps(val).lower()
-        if q in val_str:
-            matches.append(key)
+    matches = [key for key, val_str in fields.items() if q in val_str]
     return f"Matched in: {', '.join(matches)}"
 
 
+@_memoize_response
+def _cdes_overview_json() -> str:
+    """Serialized ``get_cdes_overview`` result, memoized until the next sync."""
+    schemas = []
+    for name in _all_schema_names():
+        s = _get_schema(name)
+        schemas.append(
+            {
+                "name": name,
+                "title": s.get("title", ""),
+                "description": s.get("description", ""),
+                "required": s.get("required", []),
+            }
+        )
+
+    reference_sets = []
+    for name in _all_reference_names():
+        r = _get_reference(name)
+        reference_sets.append(
+            {
+                "name": name,
+                "description": r.get("description", ""),
+                "version": r.get("version", ""),
+                "license": r.get("license", ""),
+            }
+        )
+
+    return _dumps(
+        {
+            "standard": "Cannabis Data Exchange Standard (CDES)",
+            "specVersion": "1.0.0",
+            "serverVersion": __version__,
+            "publicEndpoint": "https://mcp.cdes.world/sse",
+            "schemaVersion": "JSON Schema Draft 2020-12",
+            "baseUri": "https://schemas.terprint.com/cdes/v1/",
+            "website": "https://www.cdes.world",
+            "publisher": "Acidni LLC / Terprint",
+            "licenses": {
+                "code": "Apache-2.0",
+                "specifications": "CC-BY-4.0",
+                "referenceData": "CC0-1.0",
+            },
+            "schemas": schemas,
+            "referenceDataSets": reference_sets,
+            "links": {
+                "specification": "https://github.com/Acidni-LLC/cdes-spec",
+                "pythonSdk": "https://github.com/Acidni-LLC/cdes-sdk-python",
+                "referenceData": "https://github.com/Acidni-LLC/cdes-reference-data",
+                "mcpServer": "https://github.com/Acidni-LLC/cdes-mcp-server",
+            },
+            "tools": [
+                "list_schemas",
+                "get_schema",
+                "validate_data",
+                "get_terpene_info",
+                "get_cannabinoid_info",
+                "lookup_terpene_color",
+                "list_terpenes",
+                "list_cannabinoids",
+                "search_reference_data",
+                "get_cdes_overview",
+            ],
+        }
+    )
+
+
 @mcp.tool()
 def get_cdes_overview() -> str:
     """Get a comprehensive overview of the Cannabis Data Exchange Standard.
@@ -597,71 +1232,20 @@ def get_cdes_overview() -> str:
     Returns information about CDES including version, available schemas,
     reference data sets, licensing, and links to documentation.
     """
-    def _impl() -> str:
-        schemas = []
-        for name in _all_schema_names():
-            s = _get_schema(name)
-            schemas.append(
-                {
-                    "name": name,
-                    "title": s.get("title", ""),
-                    "description": s.get("description", ""),
-                    "required": s.get("required", []),
-                }
-            )
+    return safe_tool_call(_cdes_overview_json, tool_name="get_cdes_overview")
 
-        reference_sets = []
-        for name in _all_reference_names():
-            r = _get_reference(name)
-            reference_sets.append(
-                {
-                    "name": name,
-                    "description": r.get("description", ""),
-                    "version": r.get("version", ""),
-                    "license": r.get("license", ""),
-                }
-            )
 
-        return json.dumps(
-            {
-                "standard": "Cannabis Data Exchange Standard (CDES)",
-                "specVersion": "1.0.0",
-                "serverVersion": __version__,
-                "publicEndpoint": "https://mcp.cdes.world/sse",
-                "schemaVersion": "JSON Schema Draft 2020-12",
-                "baseUri": "https://schemas.terprint.com/cdes/v1/",
-                "website": "https://www.cdes.world",
-                "publisher": "Acidni LLC / Terprint",
-                "licenses": {
-                    "code": "Apache-2.0",
-                    "specifications": "CC-BY-4.0",
-                    "referenceData": "CC0-1.0",
-                },
-                "schemas": schemas,
-                "referenceDataSets": reference_sets,
-                "links": {
-                    "specification": "https://github.com/Acidni-LLC/cdes-spec",
-                    "pythonSdk": "https://github.com/Acidni-LLC/cdes-sdk-python",
-                    "referenceData": "https://github.com/Acidni-LLC/cdes-reference-data",
-                    "mcpServer": "https://github.com/Acidni-LLC/cdes-mcp-server",
-                },
-                "tools": [
-                    "list_schemas",
-                    "get_schema",
-                    "validate_data",
-                    "get_terpene_info",
-                    "get_cannabinoid_info",
-                    "lookup_terpene_color",
-                    "list_terpenes",
-                    "list_cannabinoids",
-                    "search_reference_data",
-                    "get_cdes_overview",
-                ],
-            },
-            indent=2,
-        )
+def _warm_responses() -> None:
+    """Pre-serialize the argument-free catalogue tools.
+
+    Their output only changes when a sync runs, so it is built at startup
+    and after each sync; the first client call is then a cache hit too.
+    """
+    for tool in (list_schemas, list_terpenes, list_cannabinoids, get_cdes_overview):
+        tool()
 
-    return safe_tool_call(_impl, tool_name="get_cdes_overview")
+
+_warm_responses()
 
 
 # ---------------------------------------------------------------------------
@@ -701,7 +1285,16 @@ async def _run_sse_server(host: str, port: int) -> None:
         ],
     )
 
-    config = uvicorn.Config(app, host=host, port=port, log_level="info")
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        http="httptools",
+        ws="none",
+        proxy_headers=True,
+        server_header=False,
+    )
     server = uvicorn.Server(config)
     await server.serve()
 
@@ -728,9 +1321,10 @@ def main() -> None:
         port = int(os.getenv("MCP_PORT", "8000"))
         logger.info("Starting CDES MCP Server (SSE) on %s:%d", host, port)
 
-        import anyio
-
-        anyio.run(_run_sse_server, host, port)
+        # The server runs inside anyio.run, so uvicorn's own ``loop`` setting
+        # never applies; uvloop has to be selected when anyio creates the loop.
+        use_uvloop = importlib.util.find_spec("uvloop") is not None
+        anyio.run(_run_sse_server, host, port, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
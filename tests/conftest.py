@@ -0,0 +1,66 @@
+"""Shared fixtures for the CDES MCP Server tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from cdes_mcp_server import server
+from cdes_mcp_server.server import (
+    _all_reference_names,
+    _all_schema_names,
+    _get_reference,
+    _get_schema,
+    _sync_targets,
+    sync_schemas_from_github,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(scope="session")
+def all_schemas() -> dict[str, dict[str, Any]]:
+    """Every discovered schema, loaded once per test session."""
+    return {name: _get_schema(name) for name in _all_schema_names()}
+
+
+@pytest.fixture(scope="session")
+def all_references() -> dict[str, dict[str, Any]]:
+    """Every discovered reference data set, loaded once per test session."""
+    return {name: _get_reference(name) for name in _all_reference_names()}
+
+
+@pytest.fixture
+def read_only_sync(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[dict[str, bytes]]:
+    """Run GitHub syncs against the files on disk, with every write failing.
+
+    Upstream serves each target's local file (404 when absent) unless the
+    test puts replacement bytes in the yielded dict, keyed by target name.
+    Persisting raises ``PermissionError`` as on a read-only install, so the
+    bundled files stay untouched and a final sync restores the served data.
+    """
+    targets = {url: (name, path) for _, name, url, path in _sync_targets()}
+    overrides: dict[str, bytes] = {}
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        name, path = targets[str(request.url)]
+        if name in overrides:
+            return httpx.Response(200, content=overrides[name], headers={"etag": '"override"'})
+        if not path.exists():
+            return httpx.Response(404)
+        return httpx.Response(200, content=path.read_bytes(), headers={"etag": '"bundled"'})
+
+    def persist_file(path: Path, raw: bytes) -> None:
+        raise PermissionError(13, "Permission denied", str(path))
+
+    monkeypatch.setattr(server, "_ETAG_FILE", tmp_path / "etags.json")
+    monkeypatch.setattr(server, "_SNAPSHOT_FILE", tmp_path / "snapshot.json")
+    monkeypatch.setattr(server, "_persist_file", persist_file)
+    monkeypatch.setattr(server, "_github_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(upstream)))
+    yield overrides
+    overrides.clear()
+    sync_schemas_from_github()
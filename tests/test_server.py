@@ -5,13 +5,20 @@ All tool functions are synchronous and return JSON strings.
 
 from __future__ import annotations
 
-import json
+import asyncio
+from typing import TYPE_CHECKING
 
+import orjson
 import pytest
 
 from cdes_mcp_server.server import (
+    _build_index,
+    _cannabinoid_row,
     _get_reference,
     _get_schema,
+    _health_endpoint,
+    _load_json,
+    _terpene_row,
     get_cannabinoid_info,
     get_cdes_overview,
     get_schema,
@@ -21,13 +28,17 @@ from cdes_mcp_server.server import (
     list_terpenes,
     lookup_terpene_color,
     search_reference_data,
+    sync_schemas_from_github,
     validate_data,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
 
-def _j(raw: str) -> dict | list:
+
+def _j(raw: str | bytes) -> dict | list:
     """Parse a JSON string returned by an MCP tool."""
-    return json.loads(raw)
+    return orjson.loads(raw)
 
 
 # ---------------------------------------------------------------------------
@@ -38,7 +49,7 @@ def _j(raw: str) -> dict | list:
 class TestSchemaLoading:
     """Verify all bundled schemas load correctly."""
 
-    EXPECTED_SCHEMAS = [
+    EXPECTED_SCHEMAS = (
         "strain",
         "terpene-profile",
         "cannabinoid-profile",
@@ -46,22 +57,14 @@ class TestSchemaLoading:
         "coa",
         "rating",
         "rating-aggregate",
-    ]
-
-    @pytest.mark.parametrize("name", EXPECTED_SCHEMAS)
-    def test_load_schema_success(self, name: str) -> None:
-        schema = _get_schema(name)
-        assert isinstance(schema, dict)
-        assert "$schema" in schema or "$id" in schema
+    )
 
     def test_load_schema_unknown_raises(self) -> None:
         with pytest.raises(FileNotFoundError):
             _get_schema("nonexistent-schema")
 
-    @pytest.mark.parametrize("name", EXPECTED_SCHEMAS)
-    def test_schema_has_title(self, name: str) -> None:
-        schema = _get_schema(name)
-        assert "title" in schema
+    def test_load_schema_is_memoized(self) -> None:
+        assert _get_schema("strain") is _get_schema("strain")
 
 
 # ---------------------------------------------------------------------------
@@ -72,51 +75,113 @@ class TestSchemaLoading:
 class TestReferenceDataLoading:
     """Verify all bundled reference data loads correctly."""
 
-    EXPECTED_REFERENCES = [
+    EXPECTED_REFERENCES = (
         "terpene-library",
         "cannabinoid-library",
         "terpene-colors",
-    ]
-
-    @pytest.mark.parametrize("name", EXPECTED_REFERENCES)
-    def test_load_reference_success(self, name: str) -> None:
-        data = _get_reference(name)
-        assert data is not None
-        assert isinstance(data, dict)
+    )
 
     def test_load_reference_unknown_raises(self) -> None:
         with pytest.raises(FileNotFoundError):
             _get_reference("nonexistent-reference")
 
-    def test_terpene_library_has_entries(self) -> None:
-        data = _get_reference("terpene-library")
-        assert len(data.get("terpenes", [])) >= 10
+    def test_load_reference_is_memoized(self) -> None:
+        assert _get_reference("terpene-library") is _get_reference("terpene-library")
+
+
+class TestLoadJson:
+    def test_parses_large_file_from_memory_map(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("cdes_mcp_server.server._MMAP_THRESHOLD", 1)
+        path = tmp_path / "data.json"
+        path.write_bytes(orjson.dumps({"terpenes": [{"id": "terpene:myrcene"}]}))
+        assert _load_json(path) == {"terpenes": [{"id": "terpene:myrcene"}]}
+
+    def test_memory_mapped_decode_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("cdes_mcp_server.server._MMAP_THRESHOLD", 1)
+        path = tmp_path / "broken.json"
+        path.write_bytes(b'{"terpenes": [')
+        with pytest.raises(orjson.JSONDecodeError):
+            _load_json(path)
+
+
+# ---------------------------------------------------------------------------
+# GitHub sync
+# ---------------------------------------------------------------------------
 
-    def test_cannabinoid_library_has_entries(self) -> None:
-        data = _get_reference("cannabinoid-library")
-        assert len(data.get("cannabinoids", [])) >= 9
 
-    def test_terpene_colors_has_entries(self) -> None:
-        data = _get_reference("terpene-colors")
-        assert len(data.get("colors", [])) >= 30
+class TestGitHubSync:
+    def test_failed_write_still_serves_synced_data(self, read_only_sync: dict[str, bytes], tmp_path: Path) -> None:
+        lib = _get_reference("terpene-library")
+        newene = {"id": "terpene:newene", "name": "Newene"}
+        read_only_sync["terpene-library"] = orjson.dumps({**lib, "terpenes": [*lib["terpenes"], newene]})
+        result = sync_schemas_from_github()
+        assert result["references_updated"] == 3
+        assert any(e.startswith("Reference terpene-library: not persisted:") for e in result["errors"])
+        assert _j(get_terpene_info(name="Newene"))["id"] == "terpene:newene"
+        assert _j((tmp_path / "etags.json").read_bytes()) == {}
 
 
 # ---------------------------------------------------------------------------
-# Tool: list_schemas
+# Bundled assets and catalogue tools
 # ---------------------------------------------------------------------------
 
 
-class TestListSchemas:
-    def test_returns_all_schemas(self) -> None:
-        result = _j(list_schemas())
-        assert isinstance(result, list)
-        assert len(result) == 7
+class TestBundledAssets:
+    """Smoke-test every bundled file and the list tools built from them."""
+
+    def test_bundled_assets_ok(self, all_schemas: dict[str, dict], all_references: dict[str, dict]) -> None:
+        for name in TestSchemaLoading.EXPECTED_SCHEMAS:
+            assert name in all_schemas, name
+            schema = all_schemas[name]
+            assert isinstance(schema, dict), name
+            assert "$schema" in schema or "$id" in schema, name
+            assert "title" in schema, name
+
+        for name in TestReferenceDataLoading.EXPECTED_REFERENCES:
+            assert name in all_references, name
+            assert isinstance(all_references[name], dict), name
+        assert len(all_references["terpene-library"].get("terpenes", [])) >= 10
+        assert len(all_references["cannabinoid-library"].get("cannabinoids", [])) >= 9
+        assert len(all_references["terpene-colors"].get("colors", [])) >= 30
+
+        schemas = _j(list_schemas())
+        assert isinstance(schemas, list)
+        assert len(schemas) == 7
+        for entry in schemas:
+            assert "name" in entry, entry
+            assert "title" in entry, entry
+
+        for tool, minimum in ((list_terpenes, 10), (list_cannabinoids, 9)):
+            entries = _j(tool())
+            assert isinstance(entries, list), tool.__name__
+            assert len(entries) >= minimum, tool.__name__
+            for entry in entries:
+                assert "id" in entry, entry
+                assert "name" in entry, entry
+
+
+class TestSummaryRows:
+    def test_keep_values_as_stored(self) -> None:
+        for value in (None, "citrus", ["citrus", "sweet"]):
+            assert _terpene_row({"id": "terpene:x", "aroma": value})[4] == value
+            assert _cannabinoid_row({"id": "cannabinoid:x", "effects": value})[5] == value
+        assert _terpene_row({"id": "terpene:x"})[4] == []
+        assert _cannabinoid_row({"id": "cannabinoid:x"})[5] == []
+
+
+# ---------------------------------------------------------------------------
+# Health endpoint
+# ---------------------------------------------------------------------------
 
-    def test_schema_entries_have_name_and_title(self) -> None:
-        entries = _j(list_schemas())
-        for entry in entries:
-            assert "name" in entry
-            assert "title" in entry
+
+class TestHealthEndpoint:
+    def test_reports_healthy_with_catalog(self) -> None:
+        response = asyncio.run(_health_endpoint(None))
+        assert response.media_type == "application/json"
+        body = _j(response.body)
+        assert body["status"] == "healthy"
+        assert "strain" in body["schemas"]
+        assert "terpene-library" in body["references"]
 
 
 # ---------------------------------------------------------------------------
@@ -156,6 +221,30 @@ class TestValidateData:
         result = _j(validate_data(schema_name="strain", data=data))
         assert result["valid"] is False
 
+    def test_formats_checked_only_on_request(self) -> None:
+        data = {
+            "id": "s1",
+            "name": "Test",
+            "type": "hybrid",
+            "sources": [{"name": "x", "retrievedDate": "not-a-date"}],
+        }
+        assert _j(validate_data(schema_name="strain", data=data))["valid"] is True
+        result = _j(validate_data(schema_name="strain", data=data, check_formats=True))
+        assert result["valid"] is False
+        assert result["errors"][0]["path"] == "sources.0.retrievedDate"
+
+    def test_reports_errors_through_defs_ref(self) -> None:
+        data = {"measurementDate": "nope", "terpenes": {"myrcene": "high"}}
+        result = _j(validate_data(schema_name="terpene-profile", data=data))
+        assert [e["path"] for e in result["errors"]] == ["terpenes.myrcene"]
+        result = _j(validate_data(schema_name="terpene-profile", data=data, check_formats=True))
+        assert {e["path"] for e in result["errors"]} == {"measurementDate", "terpenes.myrcene"}
+
+    def test_valid_data_is_not_mutated(self) -> None:
+        data = {"id": "strain-001", "name": "Blue Dream", "type": "hybrid"}
+        validate_data(schema_name="strain", data=data)
+        assert data == {"id": "strain-001", "name": "Blue Dream", "type": "hybrid"}
+
     def test_validate_unknown_schema_raises(self) -> None:
         with pytest.raises(FileNotFoundError):
             validate_data(schema_name="fake", data={"a": 1})
@@ -176,6 +265,15 @@ class TestTerpeneInfo:
         result = _j(get_terpene_info(terpene_id="terpene:myrcene"))
         assert "id" in result
 
+    def test_synonyms_index_after_names(self) -> None:
+        myrcene = {"id": "terpene:myrcene", "name": "Myrcene", "synonyms": ["beta-Myrcene", "Limonene"]}
+        limonene = {"id": "terpene:limonene", "name": "Limonene", "synonyms": [None, ""]}
+        index: dict[str, dict] = {}
+        _build_index(index, [myrcene, limonene], "name", casefold=True, alias_fields=("synonyms",))
+        assert index["beta-myrcene"] is myrcene
+        assert index["limonene"] is limonene
+        assert set(index) == {"myrcene", "limonene", "beta-myrcene"}
+
     def test_not_found(self) -> None:
         result = _j(get_terpene_info(name="unobtanium"))
         assert "error" in result
@@ -186,6 +284,14 @@ class TestCannabinoidInfo:
         result = _j(get_cannabinoid_info(name="THC"))
         assert "name" in result
 
+    def test_get_by_full_name(self) -> None:
+        result = _j(get_cannabinoid_info(name="delta-9-tetrahydrocannabinol"))
+        assert result["id"] == "cannabinoid:thc"
+
+    def test_get_by_id(self) -> None:
+        result = _j(get_cannabinoid_info(cannabinoid_id="cannabinoid:thc"))
+        assert result["name"] == "THC"
+
     def test_not_found(self) -> None:
         result = _j(get_cannabinoid_info(name="unobtanium"))
         assert "error" in result
@@ -207,37 +313,6 @@ class TestLookupTerpeneColor:
         assert "error" in result or "hex" in result  # may return default
 
 
-# ---------------------------------------------------------------------------
-# Tool: list_terpenes / list_cannabinoids
-# ---------------------------------------------------------------------------
-
-
-class TestListTerpenes:
-    def test_returns_list(self) -> None:
-        result = _j(list_terpenes())
-        assert isinstance(result, list)
-        assert len(result) >= 10
-
-    def test_terpene_entries_have_id_and_name(self) -> None:
-        entries = _j(list_terpenes())
-        for entry in entries:
-            assert "id" in entry
-            assert "name" in entry
-
-
-class TestListCannabinoids:
-    def test_returns_list(self) -> None:
-        result = _j(list_cannabinoids())
-        assert isinstance(result, list)
-        assert len(result) >= 9
-
-    def test_cannabinoid_entries_have_id_and_name(self) -> None:
-        entries = _j(list_cannabinoids())
-        for entry in entries:
-            assert "id" in entry
-            assert "name" in entry
-
-
 # ---------------------------------------------------------------------------
 # Tool: search_reference_data
 # ---------------------------------------------------------------------------
@@ -249,6 +324,18 @@ class TestSearchReferenceData:
         assert "results" in result
         assert len(result["results"]) > 0
 
+    def test_search_matches_both_libraries(self) -> None:
+        result = _j(search_reference_data(query="pain-relief"))
+        types = {r["type"] for r in result["results"]}
+        assert types == {"terpene", "cannabinoid"}
+
+    def test_repeated_query_keeps_its_spelling(self) -> None:
+        lower = _j(search_reference_data(query="myrcene"))
+        upper = _j(search_reference_data(query="MYRCENE"))
+        assert lower["results"] == upper["results"]
+        assert upper["query"] == "MYRCENE"
+        assert search_reference_data(query="MYRCENE") == search_reference_data(query="MYRCENE")
+
     def test_search_no_results(self) -> None:
         result = _j(search_reference_data(query="xyzzy_unlikely_match_12345"))
         assert "results" in result